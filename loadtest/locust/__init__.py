@@ -0,0 +1 @@
+"""Locust load tests for the OLTP Demo."""
@@ -0,0 +1,384 @@
+"""
+Shared Locust building blocks for the OLTP Demo load tests.
+
+Holds the base user class, event handlers, data generators and performance
+threshold helpers used by locustfile.py and every scenario under scenarios/.
+Scenarios import from here as a package (``loadtest.locust.common``), so
+load tests are run from the repository root.
+
+See: specs/001-oltp-core-demo/spec.md - US3: Performance Under Load
+"""
+
+import logging
+import os
+import random
+import time
+from typing import Optional
+
+import orjson
+from locust import between, events
+from locust.contrib.fasthttp import FastHttpUser
+from locust.runners import MasterRunner, WorkerRunner
+
+from loadtest.locust.sampling import Lcg, weighted_choice  # noqa: F401 (re-exported)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class OltpDemoUser(FastHttpUser):
+    """
+    Base user class for OLTP demonstration load tests.
+
+    Provides common configuration and utility methods for all test scenarios.
+    Uses FastHttpUser (geventhttpclient) instead of HttpUser (python-requests)
+    to keep the load generator's per-request CPU cost low.
+    """
+
+    # Base class only: keep Locust from spawning it from files that import it
+    abstract = True
+
+    # Wait time between tasks (1-3 seconds)
+    wait_time = between(1, 3)
+
+    # Common headers, set once on the session and sent with every request
+    default_headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json"
+    }
+
+    def on_start(self):
+        """
+        Called when a user starts executing tasks.
+        Initialize user state and resources.
+        """
+        logger.info("User %s started", self.environment.runner.user_count)
+        self.rng = Lcg()
+        self.user_id = self.rng.randint(1, 100)
+        self.account_id = self.rng.randint(1, 100)
+
+    def on_stop(self):
+        """
+        Called when a user stops executing tasks.
+        Cleanup resources.
+        """
+        logger.info("User stopped")
+
+    def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        name: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Make an HTTP request with error handling and metrics.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            name: Custom name for the request in statistics
+            **kwargs: Additional arguments for the request
+
+        Returns:
+            Response object or None if request failed
+        """
+        request_kwargs = {"catch_response": True, **kwargs}
+
+        with self.client.request(
+            method,
+            endpoint,
+            name=name or f"{method} {endpoint}",
+            **request_kwargs
+        ) as response:
+            try:
+                if response.status_code == 200:
+                    response.success()
+                    return response
+                elif response.status_code == 500:
+                    response.failure(f"Server error: {response.text[:100]}")
+                elif response.status_code == 404:
+                    response.failure(f"Not found: {endpoint}")
+                else:
+                    response.failure(f"Unexpected status: {response.status_code}")
+
+            except Exception as e:
+                response.failure(f"Exception: {str(e)}")
+                logger.error("Request failed: %s", e)
+
+        return None
+
+    def parse_json(self, response):
+        """
+        Decode a JSON response body with orjson.
+
+        Reads the raw bytes from ``response.content`` to skip the text decode
+        that ``response.json()`` goes through.
+
+        Args:
+            response: Response object returned by the client
+
+        Returns:
+            Decoded JSON value
+        """
+        return orjson.loads(response.content)
+
+
+# =============================================================================
+# Locust Event Handlers
+# =============================================================================
+
+_BANNER = "=" * 80
+
+# Multi-line log messages, each emitted with a single logging call
+_INIT_TEMPLATE = "Locust initialized\nHost: %s\nRunning in %s mode"
+_TEST_START_TEMPLATE = f"{_BANNER}\nOLTP Demo Load Test Starting\n{_BANNER}\nTarget host: %s"
+_TEST_STOP_TEMPLATE = (
+    f"{_BANNER}\nOLTP Demo Load Test Completed\n{_BANNER}\n"
+    "Total requests: %d\n"
+    "Total failures: %d\n"
+    "Average response time: %.2fms\n"
+    "RPS: %.2f"
+)
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser, **kwargs):
+    """
+    Called when Locust builds its command line parser.
+
+    Add OLTP Demo specific options.
+    """
+    parser.add_argument(
+        "--log-request-failures",
+        action="store_true",
+        default=False,
+        help="Log every failed request (failures are always counted in the Locust stats)",
+    )
+    parser.add_argument(
+        "--pin-worker-cpu",
+        action="store_true",
+        default=False,
+        help=(
+            "Pin each worker process to its own CPU, chosen by worker index "
+            "(Linux only; single-host --processes runs only)"
+        ),
+    )
+
+
+@events.init.add_listener
+def on_locust_init(environment, **kwargs):
+    """
+    Called when Locust is initialized.
+
+    Configure test environment and logging.
+    """
+    if isinstance(environment.runner, MasterRunner):
+        mode = "MASTER"
+    elif isinstance(environment.runner, WorkerRunner):
+        mode = "WORKER"
+    else:
+        mode = "STANDALONE"
+    logger.info(_INIT_TEMPLATE, environment.host, mode)
+
+    # on_request would run for every request; only subscribe it when asked to
+    options = environment.parsed_options
+    if options is not None and options.log_request_failures:
+        environment.events.request.add_listener(on_request)
+
+    if mode == "WORKER" and options is not None and options.pin_worker_cpu:
+        pin_worker_cpu(environment.runner.worker_index)
+
+
+def pin_worker_cpu(worker_index: int):
+    """
+    Pin the current worker process to a single CPU.
+
+    Each worker runs its users on one gevent thread, so keeping it on one core
+    avoids cross-core migrations and keeps its caches warm. Workers are spread
+    round-robin over the CPUs this process is allowed to use.
+
+    Only meant for single-host runs (``--processes``). The master numbers
+    workers across all hosts, so on a multi-host run each host sees gaps in
+    the indices, and its workers end up sharing some cores while others sit
+    idle.
+
+    Master/worker traffic goes over ZeroMQ, which already sets TCP_NODELAY on
+    its TCP sockets. Remaining network tuning (e.g. the qdisc on the load
+    generator's interface, ``tc qdisc replace dev <iface> root fq``) is done
+    at the host level, outside of Locust.
+
+    Args:
+        worker_index: Index assigned to this worker by the master
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        logger.warning("CPU pinning is not supported on this platform")
+        return
+
+    cpus = sorted(os.sched_getaffinity(0))
+    cpu = cpus[worker_index % len(cpus)]
+    os.sched_setaffinity(0, {cpu})
+    logger.info("Worker %d pinned to CPU %d", worker_index, cpu)
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """
+    Called when test starts.
+
+    Log test configuration and setup.
+    """
+    logger.info(_TEST_START_TEMPLATE, environment.host)
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    """
+    Called when test stops.
+
+    Log final statistics and cleanup.
+    """
+    # Log summary statistics
+    total = environment.stats.total
+    logger.info(
+        _TEST_STOP_TEMPLATE,
+        total.num_requests,
+        total.num_failures,
+        total.avg_response_time,
+        total.total_rps,
+    )
+
+
+def on_request(request_type, name, response_time, response_length, exception, **kwargs):
+    """
+    Called on every request when --log-request-failures is set.
+
+    Can be used for custom metrics or logging. Kept to a bare early return on
+    the success path since it runs once per request.
+    """
+    if exception is None:
+        return
+    logger.error("Request failed: %s - %s", name, exception)
+
+
+# =============================================================================
+# Utility Functions
+# =============================================================================
+
+def generate_account_data(rng=random):
+    """
+    Generate random account data for test requests.
+
+    Args:
+        rng: Random source, e.g. the user's Lcg (defaults to the random module)
+
+    Returns:
+        dict: Account data with random values
+    """
+    return {
+        "userId": rng.randint(1, 100),
+        "accountTypeId": rng.randint(1, 3),
+        "balance": round(rng.uniform(100, 10000), 2),
+        "status": rng.choice(("ACTIVE", "ACTIVE", "ACTIVE", "SUSPENDED"))
+    }
+
+
+def generate_transfer_data(rng=random):
+    """
+    Generate random transfer data for test requests.
+
+    Args:
+        rng: Random source, e.g. the user's Lcg (defaults to the random module)
+
+    Returns:
+        dict: Transfer data with random values
+    """
+    from_account = rng.randint(1, 100)
+    # Offset by 1..99 (mod 100) so the accounts always differ without a retry loop
+    to_account = (from_account - 1 + rng.randint(1, 99)) % 100 + 1
+
+    return {
+        "fromAccountId": from_account,
+        "toAccountId": to_account,
+        "amount": round(rng.uniform(10, 500), 2)
+    }
+
+
+# =============================================================================
+# Performance Metrics Helpers
+# =============================================================================
+
+# Success rate threshold (percentage)
+MIN_SUCCESS_RATE = 95.0
+
+# Throughput threshold (requests per second)
+MIN_RPS = 100
+
+
+class PerformanceThresholds:
+    """
+    Define performance thresholds for different operations.
+
+    Used to validate that performance meets requirements.
+    """
+
+    # Response time thresholds (milliseconds)
+    SIMPLE_QUERY_MAX = 50
+    COMPLEX_QUERY_MAX = 200
+    TRANSACTION_MAX = 100
+    BATCH_OPERATION_MAX = 500
+
+    # Success rate thresholds (percentage)
+    MIN_SUCCESS_RATE = MIN_SUCCESS_RATE
+
+    # Throughput thresholds (requests per second)
+    MIN_RPS = MIN_RPS
+
+
+def check_performance_thresholds(stats):
+    """
+    Check if performance meets defined thresholds.
+
+    Args:
+        stats: Locust statistics object
+
+    Returns:
+        bool: True if all thresholds met, False otherwise
+    """
+    issues = []
+
+    total = stats.total
+    total_requests = total.num_requests
+    total_failures = total.num_failures
+    total_rps = total.total_rps
+
+    # Check success rate
+    if total_requests > 0:
+        success_rate = 100.0 - (total_failures * 100.0 / total_requests)
+
+        if success_rate < MIN_SUCCESS_RATE:
+            issues.append(
+                f"Success rate ({success_rate:.1f}%) below threshold "
+                f"({MIN_SUCCESS_RATE}%)"
+            )
+
+    # Check RPS
+    if total_rps < MIN_RPS:
+        issues.append(
+            f"RPS ({total_rps:.1f}) below threshold "
+            f"({MIN_RPS})"
+        )
+
+    if issues:
+        logger.warning("Performance threshold violations:")
+        for issue in issues:
+            logger.warning("  - %s", issue)
+        return False
+
+    logger.info("All performance thresholds met!")
+    return True
+
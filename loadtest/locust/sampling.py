@@ -0,0 +1,141 @@
+"""
+Cheap random sampling helpers for the OLTP Demo load tests.
+
+Lcg covers occasional draws; BufferedSampler serves the per-task draws from
+numpy-generated batches.
+
+Kept free of any locust import so that runners which do not use gevent
+(see scenarios/performance_demo_asyncio.py) can share them.
+"""
+
+import bisect
+import itertools
+import os
+import random
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np
+
+# 64-bit LCG constants (Knuth's MMIX)
+_LCG_MULTIPLIER = 6364136223846793005
+_LCG_INCREMENT = 1442695040888963407
+_LCG_MASK = (1 << 64) - 1
+_LCG_FLOAT_SCALE = 1.0 / (1 << 53)
+
+
+class Lcg:
+    """
+    Per-user 64-bit linear congruential generator.
+
+    Much cheaper per draw than the stdlib Mersenne Twister, and more than
+    good enough for picking request parameters. Exposes the subset of the
+    ``random`` module API used by the load tests, so either can be passed
+    wherever an ``rng`` is accepted.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self._state = seed & _LCG_MASK
+
+    def next(self) -> int:
+        """Advance the generator and return the raw 64-bit state."""
+        self._state = (self._state * _LCG_MULTIPLIER + _LCG_INCREMENT) & _LCG_MASK
+        return self._state
+
+    def randint(self, a: int, b: int) -> int:
+        """Return a random integer N such that a <= N <= b."""
+        # The high bits of an LCG are far better distributed than the low bits
+        return a + (self.next() >> 32) % (b - a + 1)
+
+    def choice(self, seq):
+        """Return a random element from a non-empty sequence."""
+        return seq[(self.next() >> 32) % len(seq)]
+
+    def random(self) -> float:
+        """Return a random float in [0.0, 1.0)."""
+        return (self.next() >> 11) * _LCG_FLOAT_SCALE
+
+    def uniform(self, a: float, b: float) -> float:
+        """Return a random float N such that a <= N < b."""
+        return a + (b - a) * self.random()
+
+
+@lru_cache(maxsize=64)
+def _cumulative_weights(choices_with_weights):
+    """Split a hashable (choice, weight) table into choices and cumulative weights."""
+    choices, weights = zip(*choices_with_weights)
+    return choices, tuple(itertools.accumulate(weights))
+
+
+def weighted_choice(choices_with_weights, rng=random):
+    """
+    Make a weighted random choice.
+
+    The cumulative weights are cached per table, so callers should pass the
+    same tuple each time rather than rebuilding it.
+
+    Args:
+        choices_with_weights: Tuple of (choice, weight) tuples
+        rng: Random source, e.g. the user's Lcg (defaults to the random module)
+
+    Returns:
+        Selected choice
+    """
+    choices, cum_weights = _cumulative_weights(choices_with_weights)
+    return choices[bisect.bisect(cum_weights, rng.random() * cum_weights[-1])]
+
+
+class BufferedSampler:
+    """
+    Draws from a fixed sequence in bulk with numpy's PCG64 generator.
+
+    A single numpy call fills a buffer of ``size`` indices, which are then
+    handed out one at a time, so each draw costs a list pop rather than a
+    Python-level RNG call.
+    """
+
+    __slots__ = ("_choices", "_p", "_size", "_seed", "_rng", "_buffer")
+
+    def __init__(
+        self,
+        choices: Sequence,
+        weights: Optional[Sequence[float]] = None,
+        size: int = 1024,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            choices: Sequence to sample from (shared, not copied)
+            weights: Optional relative weights, one per choice (uniform if omitted)
+            size: Number of draws generated per refill
+            seed: Seed for the generator (fresh OS entropy at the first draw if omitted)
+        """
+        self._choices = choices
+        if weights is None:
+            self._p = None
+        else:
+            total = float(sum(weights))
+            self._p = [weight / total for weight in weights]
+        self._size = size
+        self._seed = seed
+        # Created on the first refill rather than here: module-level samplers
+        # are built when Locust imports the locustfile, before it forks its
+        # --processes workers, and a generator seeded at that point would hand
+        # every worker the same sequence.
+        self._rng = None
+        self._buffer = []
+
+    def next(self):
+        """Return the next sampled choice."""
+        buffer = self._buffer
+        if not buffer:
+            if self._rng is None:
+                self._rng = np.random.default_rng(self._seed)
+            buffer = self._buffer = self._rng.choice(
+                len(self._choices), size=self._size, p=self._p
+            ).tolist()
+        return self._choices[buffer.pop()]
@@ -0,0 +1 @@
+"""Locust load test scenarios for the OLTP Demo."""
@@ -2,41 +2,61 @@
 Performance demonstration load test scenarios.
 
 Tests connection pooling, batch operations, caching, and indexing
-under realistic load conditions.
+under realistic load conditions. Each scenario is a user class with flat
+tasks; their weights split a mixed run 40/30/20/10 across pooling, caching,
+batch operations and indexing.
 
-Usage:
-    # Run connection pooling test
-    locust -f scenarios/performance_demo.py --host=http://localhost:8080 \\
+Usage (from the repository root):
+    # Run all performance scenarios
+    locust -f loadtest/locust/scenarios/performance_demo.py --host=http://localhost:8080 \\
            --users 100 --spawn-rate 10 --run-time 60s --headless
 
+    # Run connection pooling test only
+    locust -f loadtest/locust/scenarios/performance_demo.py --host=http://localhost:8080 \\
+           --users 100 --spawn-rate 10 --run-time 60s --headless ConnectionPoolingUser
+
     # Run with web UI for monitoring
-    locust -f scenarios/performance_demo.py --host=http://localhost:8080
+    locust -f loadtest/locust/scenarios/performance_demo.py --host=http://localhost:8080
 
 See: specs/001-oltp-core-demo/spec.md - US3: Performance Under Load
 """
 
-import random
-import sys
-from pathlib import Path
-
-# Add parent directory to path to import locustfile
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from locust import HttpUser, TaskSet, between, task
-from locustfile import OltpDemoUser, generate_account_data, generate_transfer_data
-
 import logging
 
+from locust import between, task
+
+from loadtest.locust.common import OltpDemoUser, generate_account_data, generate_transfer_data
+from loadtest.locust.sampling import BufferedSampler
+from loadtest.locust.scenarios.performance_endpoints import (
+    BATCH_BODIES,
+    BATCH_PARAMS,
+    CACHE_ITERATIONS,
+    CACHING_URLS,
+    CONCURRENT_POOL_PARAMS,
+    CONCURRENT_POOL_URLS,
+    DEMO_IDS,
+    INDEXED_QUERY_URLS,
+    INDEXING_URLS,
+    JPA_BATCH_URLS,
+    JPA_RECORD_COUNTS,
+    POOL_ITERATIONS,
+    POOL_URLS,
+)
+
 logger = logging.getLogger(__name__)
 
+# Per-task account/user ids, drawn in bulk by numpy. One sampler serves every
+# user in the process; gevent runs them all on a single thread.
+_next_id = BufferedSampler(DEMO_IDS).next
+
 
 # =============================================================================
 # Connection Pooling Test Scenarios
 # =============================================================================
 
-class ConnectionPoolingTasks(TaskSet):
+class ConnectionPoolingUser(OltpDemoUser):
     """
-    Tasks for testing connection pooling performance.
+    User for testing connection pooling performance.
 
     Demonstrates the impact of HikariCP connection pooling on:
     - Query response times
@@ -44,6 +64,16 @@ class ConnectionPoolingTasks(TaskSet):
     - Connection pool statistics
     """
 
+    weight = 4  # 40% of users
+    wait_time = between(0.5, 2)
+
+    def on_start(self):
+        """Start each parameter rotation at a random offset so users are not in lockstep."""
+        super().on_start()
+        rng = self.rng
+        self._pool_ix = rng.randint(0, len(POOL_ITERATIONS) - 1)
+        self._concurrent_ix = rng.randint(0, len(CONCURRENT_POOL_PARAMS) - 1)
+
     @task(10)
     def test_pooled_connections(self):
         """
@@ -51,30 +81,32 @@ class ConnectionPoolingTasks(TaskSet):
 
         This should be significantly faster than unpooled connections.
         """
-        iterations = random.choice([10, 50, 100])
+        # Rotate through the iteration counts rather than drawing one per call
+        ix = self._pool_ix
+        self._pool_ix = (ix + 1) % len(POOL_ITERATIONS)
+        iterations = POOL_ITERATIONS[ix]
 
-        response = self.client.get(
-            f"/api/demos/performance/connection-pooling?iterations={iterations}",
+        with self.client.get(
+            POOL_URLS[iterations],
             name="Connection Pooling (Pooled)",
             catch_response=True
-        )
-
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                speedup = data.get("speedupFactor", 0)
-
-                # Verify pooling provides significant speedup
-                if speedup > 2.0:
-                    response.success()
-                    logger.debug(f"Connection pooling speedup: {speedup:.1f}x")
-                else:
-                    response.failure(f"Insufficient speedup: {speedup:.1f}x (expected > 2x)")
-
-            except Exception as e:
-                response.failure(f"Failed to parse response: {e}")
-        else:
-            response.failure(f"HTTP {response.status_code}")
+        ) as response:
+            if response.status_code == 200:
+                try:
+                    data = self.parse_json(response)
+                    speedup = data.get("speedupFactor", 0)
+
+                    # Verify pooling provides significant speedup
+                    if speedup > 2.0:
+                        response.success()
+                        logger.debug("Connection pooling speedup: %.1fx", speedup)
+                    else:
+                        response.failure(f"Insufficient speedup: {speedup:.1f}x (expected > 2x)")
+
+                except Exception as e:
+                    response.failure(f"Failed to parse response: {e}")
+            else:
+                response.failure(f"HTTP {response.status_code}")
 
     @task(5)
     def test_concurrent_pooling(self):
@@ -83,31 +115,30 @@ class ConnectionPoolingTasks(TaskSet):
 
         Simulates multiple clients hitting the pool simultaneously.
         """
-        concurrent_clients = random.choice([10, 20, 50])
-        queries_per_client = random.choice([5, 10])
+        ix = self._concurrent_ix
+        self._concurrent_ix = (ix + 1) % len(CONCURRENT_POOL_PARAMS)
+        concurrent_clients, queries_per_client = CONCURRENT_POOL_PARAMS[ix]
 
-        response = self.client.get(
-            f"/api/demos/performance/connection-pooling/concurrent"
-            f"?concurrentClients={concurrent_clients}&queriesPerClient={queries_per_client}",
+        with self.client.get(
+            CONCURRENT_POOL_URLS[(concurrent_clients, queries_per_client)],
             name="Concurrent Connection Pooling",
             catch_response=True
-        )
-
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                success_rate = (data.get("successfulQueries", 0) * 100.0) / data.get("totalQueries", 1)
-
-                # Verify high success rate under concurrency
-                if success_rate >= 95.0:
-                    response.success()
-                else:
-                    response.failure(f"Low success rate: {success_rate:.1f}%")
-
-            except Exception as e:
-                response.failure(f"Failed to parse response: {e}")
-        else:
-            response.failure(f"HTTP {response.status_code}")
+        ) as response:
+            if response.status_code == 200:
+                try:
+                    data = self.parse_json(response)
+                    success_rate = (data.get("successfulQueries", 0) * 100.0) / data.get("totalQueries", 1)
+
+                    # Verify high success rate under concurrency
+                    if success_rate >= 95.0:
+                        response.success()
+                    else:
+                        response.failure(f"Low success rate: {success_rate:.1f}%")
+
+                except Exception as e:
+                    response.failure(f"Failed to parse response: {e}")
+            else:
+                response.failure(f"HTTP {response.status_code}")
 
     @task(2)
     def get_pool_statistics(self):
@@ -126,9 +157,9 @@ class ConnectionPoolingTasks(TaskSet):
 # Batch Operations Test Scenarios
 # =============================================================================
 
-class BatchOperationsTasks(TaskSet):
+class BatchOperationsUser(OltpDemoUser):
     """
-    Tasks for testing batch operation performance.
+    User for testing batch operation performance.
 
     Demonstrates throughput improvements from batching:
     - Individual vs batch inserts
@@ -136,6 +167,16 @@ class BatchOperationsTasks(TaskSet):
     - JPA vs JDBC batch performance
     """
 
+    weight = 2  # 20% of users
+    wait_time = between(1, 4)  # Longer wait due to batch operations
+
+    def on_start(self):
+        """Start each parameter rotation at a random offset so users are not in lockstep."""
+        super().on_start()
+        rng = self.rng
+        self._batch_ix = rng.randint(0, len(BATCH_PARAMS) - 1)
+        self._jpa_ix = rng.randint(0, len(JPA_RECORD_COUNTS) - 1)
+
     @task(8)
     def test_batch_operations(self):
         """
@@ -143,32 +184,32 @@ class BatchOperationsTasks(TaskSet):
 
         Compare individual vs batch inserts.
         """
-        record_count = random.choice([50, 100, 200])
-        batch_size = random.choice([50, 100])
+        ix = self._batch_ix
+        self._batch_ix = (ix + 1) % len(BATCH_PARAMS)
+        record_count, batch_size = BATCH_PARAMS[ix]
 
-        response = self.client.post(
+        with self.client.post(
             "/api/demos/performance/batch-operations",
-            json={"recordCount": record_count, "batchSize": batch_size},
+            data=BATCH_BODIES[(record_count, batch_size)],
             name="Batch Operations",
             catch_response=True
-        )
-
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                speedup = data.get("speedupFactor", 0)
-
-                # Verify batching provides significant speedup
-                if speedup > 3.0:
-                    response.success()
-                    logger.debug(f"Batch operations speedup: {speedup:.1f}x")
-                else:
-                    response.failure(f"Insufficient speedup: {speedup:.1f}x (expected > 3x)")
-
-            except Exception as e:
-                response.failure(f"Failed to parse response: {e}")
-        else:
-            response.failure(f"HTTP {response.status_code}")
+        ) as response:
+            if response.status_code == 200:
+                try:
+                    data = self.parse_json(response)
+                    speedup = data.get("speedupFactor", 0)
+
+                    # Verify batching provides significant speedup
+                    if speedup > 3.0:
+                        response.success()
+                        logger.debug("Batch operations speedup: %.1fx", speedup)
+                    else:
+                        response.failure(f"Insufficient speedup: {speedup:.1f}x (expected > 3x)")
+
+                except Exception as e:
+                    response.failure(f"Failed to parse response: {e}")
+            else:
+                response.failure(f"HTTP {response.status_code}")
 
     @task(4)
     def test_jpa_batch(self):
@@ -177,38 +218,39 @@ class BatchOperationsTasks(TaskSet):
 
         Compare JPA batch processing to JDBC.
         """
-        record_count = random.choice([50, 100])
+        ix = self._jpa_ix
+        self._jpa_ix = (ix + 1) % len(JPA_RECORD_COUNTS)
+        record_count = JPA_RECORD_COUNTS[ix]
 
-        response = self.client.post(
-            f"/api/demos/performance/batch-operations/jpa?recordCount={record_count}",
+        with self.client.post(
+            JPA_BATCH_URLS[record_count],
             name="JPA Batch Operations",
             catch_response=True
-        )
+        ) as response:
+            if response.status_code == 200:
+                try:
+                    data = self.parse_json(response)
+                    records_per_sec = data.get("recordsPerSecond", 0)
 
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                records_per_sec = data.get("recordsPerSecond", 0)
+                    # Verify acceptable throughput
+                    if records_per_sec > 50:
+                        response.success()
+                    else:
+                        response.failure(f"Low throughput: {records_per_sec:.1f} records/sec")
 
-                # Verify acceptable throughput
-                if records_per_sec > 50:
-                    response.success()
-                else:
-                    response.failure(f"Low throughput: {records_per_sec:.1f} records/sec")
-
-            except Exception as e:
-                response.failure(f"Failed to parse response: {e}")
-        else:
-            response.failure(f"HTTP {response.status_code}")
+                except Exception as e:
+                    response.failure(f"Failed to parse response: {e}")
+            else:
+                response.failure(f"HTTP {response.status_code}")
 
 
 # =============================================================================
 # Caching Test Scenarios
 # =============================================================================
 
-class CachingTasks(TaskSet):
+class CachingUser(OltpDemoUser):
     """
-    Tasks for testing caching performance.
+    User for testing caching performance.
 
     Demonstrates cache hit benefits:
     - Cache hits vs misses
@@ -216,9 +258,13 @@ class CachingTasks(TaskSet):
     - Cache statistics
     """
 
+    weight = 3  # 30% of users
+    wait_time = between(0.5, 2)
+
     def on_start(self):
-        """Initialize account IDs for consistent cache testing."""
-        self.account_ids = list(range(1, 101))
+        """Start the iteration rotation at a random offset so users are not in lockstep."""
+        super().on_start()
+        self._iterations_ix = self.rng.randint(0, len(CACHE_ITERATIONS) - 1)
 
     @task(15)
     def test_caching(self):
@@ -227,35 +273,36 @@ class CachingTasks(TaskSet):
 
         First query should miss cache, subsequent queries should hit.
         """
-        account_id = random.choice(self.account_ids)
-        iterations = random.choice([5, 10])
+        account_id = _next_id()
+        ix = self._iterations_ix
+        self._iterations_ix = (ix + 1) % len(CACHE_ITERATIONS)
+        iterations = CACHE_ITERATIONS[ix]
 
-        response = self.client.get(
-            f"/api/demos/performance/caching?accountId={account_id}&iterations={iterations}",
+        with self.client.get(
+            CACHING_URLS[(account_id, iterations)],
             name="Caching Performance",
             catch_response=True
-        )
-
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                speedup = data.get("speedupFactor", 0)
-                hit_rate = data.get("cacheHitRate", 0)
-
-                # Verify caching provides speedup and high hit rate
-                if speedup > 1.5 and hit_rate > 70:
-                    response.success()
-                    logger.debug(f"Cache speedup: {speedup:.1f}x, hit rate: {hit_rate:.1f}%")
-                else:
-                    response.failure(
-                        f"Insufficient performance: {speedup:.1f}x speedup, "
-                        f"{hit_rate:.1f}% hit rate"
-                    )
-
-            except Exception as e:
-                response.failure(f"Failed to parse response: {e}")
-        else:
-            response.failure(f"HTTP {response.status_code}")
+        ) as response:
+            if response.status_code == 200:
+                try:
+                    data = self.parse_json(response)
+                    speedup = data.get("speedupFactor", 0)
+                    hit_rate = data.get("cacheHitRate", 0)
+
+                    # Verify caching provides speedup and high hit rate
+                    if speedup > 1.5 and hit_rate > 70:
+                        response.success()
+                        logger.debug("Cache speedup: %.1fx, hit rate: %.1f%%", speedup, hit_rate)
+                    else:
+                        response.failure(
+                            f"Insufficient performance: {speedup:.1f}x speedup, "
+                            f"{hit_rate:.1f}% hit rate"
+                        )
+
+                except Exception as e:
+                    response.failure(f"Failed to parse response: {e}")
+            else:
+                response.failure(f"HTTP {response.status_code}")
 
     @task(2)
     def clear_cache(self):
@@ -286,9 +333,9 @@ class CachingTasks(TaskSet):
 # Indexing Test Scenarios
 # =============================================================================
 
-class IndexingTasks(TaskSet):
+class IndexingUser(OltpDemoUser):
     """
-    Tasks for testing database indexing performance.
+    User for testing database indexing performance.
 
     Demonstrates index benefits:
     - Indexed queries vs sequential scans
@@ -296,6 +343,9 @@ class IndexingTasks(TaskSet):
     - Query performance metrics
     """
 
+    weight = 1  # 10% of users
+    wait_time = between(1, 3)
+
     @task(10)
     def test_indexing(self):
         """
@@ -303,30 +353,29 @@ class IndexingTasks(TaskSet):
 
         Compare indexed lookup vs sequential scan.
         """
-        user_id = random.randint(1, 100)
+        user_id = _next_id()
 
-        response = self.client.get(
-            f"/api/demos/performance/indexing?userId={user_id}",
+        with self.client.get(
+            INDEXING_URLS[user_id],
             name="Indexing Performance",
             catch_response=True
-        )
-
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                speedup = data.get("speedupFactor", 0)
-
-                # Verify indexing provides massive speedup
-                if speedup > 5.0:
-                    response.success()
-                    logger.debug(f"Index speedup: {speedup:.1f}x")
-                else:
-                    response.failure(f"Insufficient speedup: {speedup:.1f}x (expected > 5x)")
-
-            except Exception as e:
-                response.failure(f"Failed to parse response: {e}")
-        else:
-            response.failure(f"HTTP {response.status_code}")
+        ) as response:
+            if response.status_code == 200:
+                try:
+                    data = self.parse_json(response)
+                    speedup = data.get("speedupFactor", 0)
+
+                    # Verify indexing provides massive speedup
+                    if speedup > 5.0:
+                        response.success()
+                        logger.debug("Index speedup: %.1fx", speedup)
+                    else:
+                        response.failure(f"Insufficient speedup: {speedup:.1f}x (expected > 5x)")
+
+                except Exception as e:
+                    response.failure(f"Failed to parse response: {e}")
+            else:
+                response.failure(f"HTTP {response.status_code}")
 
     @task(5)
     def test_indexed_query_explain(self):
@@ -335,89 +384,34 @@ class IndexingTasks(TaskSet):
 
         Verify index usage.
         """
-        user_id = random.randint(1, 100)
+        user_id = _next_id()
 
-        response = self.client.get(
-            f"/api/demos/performance/indexing/indexed-query?userId={user_id}",
+        with self.client.get(
+            INDEXED_QUERY_URLS[user_id],
             name="Indexed Query (EXPLAIN)",
             catch_response=True
-        )
-
-        if response.status_code == 200:
-            try:
-                data = response.json()
-                used_index = data.get("usedIndex", False)
-
-                if used_index:
-                    response.success()
-                else:
-                    response.failure("Query did not use index")
-
-            except Exception as e:
-                response.failure(f"Failed to parse response: {e}")
-        else:
-            response.failure(f"HTTP {response.status_code}")
-
-
-# =============================================================================
-# Combined Performance Test User
-# =============================================================================
-
-class PerformanceDemoUser(OltpDemoUser):
-    """
-    User that runs all performance test scenarios.
-
-    This user type distributes load across all performance optimization
-    demonstrations:
-    - Connection pooling (high priority)
-    - Batch operations (medium priority)
-    - Caching (high priority)
-    - Indexing (medium priority)
-    """
-
-    wait_time = between(1, 3)
-
-    tasks = {
-        ConnectionPoolingTasks: 4,  # 40% of tasks
-        CachingTasks: 3,             # 30% of tasks
-        BatchOperationsTasks: 2,     # 20% of tasks
-        IndexingTasks: 1             # 10% of tasks
-    }
-
-
-# =============================================================================
-# Specialized User Types for Focused Testing
-# =============================================================================
-
-class ConnectionPoolingUser(OltpDemoUser):
-    """User focused only on connection pooling tests."""
-    wait_time = between(0.5, 2)
-    tasks = [ConnectionPoolingTasks]
+        ) as response:
+            if response.status_code == 200:
+                try:
+                    data = self.parse_json(response)
+                    used_index = data.get("usedIndex", False)
 
+                    if used_index:
+                        response.success()
+                    else:
+                        response.failure("Query did not use index")
 
-class BatchOperationsUser(OltpDemoUser):
-    """User focused only on batch operation tests."""
-    wait_time = between(1, 4)  # Longer wait due to batch operations
-    tasks = [BatchOperationsTasks]
-
-
-class CachingUser(OltpDemoUser):
-    """User focused only on caching tests."""
-    wait_time = between(0.5, 2)
-    tasks = [CachingTasks]
-
-
-class IndexingUser(OltpDemoUser):
-    """User focused only on indexing tests."""
-    wait_time = between(1, 3)
-    tasks = [IndexingTasks]
+                except Exception as e:
+                    response.failure(f"Failed to parse response: {e}")
+            else:
+                response.failure(f"HTTP {response.status_code}")
 
 
 if __name__ == "__main__":
-    # Run with the combined performance demo user
+    # Run all performance users with their weights
     import os
     os.system(
-        "locust -f scenarios/performance_demo.py "
+        "locust -f loadtest/locust/scenarios/performance_demo.py "
         "--host=http://localhost:8080 "
         "--users 50 --spawn-rate 5"
     )
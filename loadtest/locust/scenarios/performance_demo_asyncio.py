@@ -0,0 +1,482 @@
+"""
+Headless asyncio runner for the performance demonstration scenarios.
+
+Drives the same endpoints, parameters and weights as performance_demo.py from
+a single asyncio event loop using httpx.AsyncClient with keep-alive pooling,
+instead of Locust's gevent greenlets. Intended for headless maximum-RPS runs:
+virtual users issue requests back to back with no wait time. Keep using the
+Locust scenarios for the web UI and distributed runs.
+
+Results are printed as a summary table and can be written as a Locust-style
+``<prefix>_stats.csv`` so they can be compared with Locust runs.
+
+On Linux/macOS the event loop is uvloop when it is installed (optional),
+which cuts per-request event loop and syscall overhead; otherwise the
+default asyncio loop is used.
+
+This module must not import locust (directly or via common.py): locust
+monkey-patches the standard library with gevent on import, which breaks
+asyncio.
+
+Usage (from the repository root):
+    python -m loadtest.locust.scenarios.performance_demo_asyncio \\
+           --host=http://localhost:8080 --users 1000 --run-time 60 --csv results/perf
+
+See: specs/001-oltp-core-demo/spec.md - US3: Performance Under Load
+"""
+
+import argparse
+import asyncio
+import csv
+import logging
+import sys
+import time
+from typing import Dict, Optional, Tuple
+
+import httpx
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # optional dependency
+    uvloop = None
+
+from loadtest.locust.sampling import BufferedSampler, Lcg, weighted_choice
+from loadtest.locust.scenarios.performance_endpoints import (
+    BATCH_BODIES,
+    BATCH_PARAMS,
+    CACHE_ITERATIONS,
+    CACHING_URLS,
+    CONCURRENT_POOL_PARAMS,
+    CONCURRENT_POOL_URLS,
+    DEMO_IDS,
+    INDEXED_QUERY_URLS,
+    INDEXING_URLS,
+    JPA_BATCH_URLS,
+    JPA_RECORD_COUNTS,
+    POOL_ITERATIONS,
+    POOL_URLS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Per-task account/user ids, drawn in bulk by numpy and shared by every
+# virtual user on the (single-threaded) event loop
+_next_id = BufferedSampler(DEMO_IDS).next
+
+HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
+
+# Per-request timeout in seconds, matching FastHttpUser.network_timeout
+DEFAULT_TIMEOUT = 60.0
+
+# Percentiles reported in Locust's stats CSV
+PERCENTILES = (0.50, 0.66, 0.75, 0.80, 0.90, 0.95, 0.98, 0.99, 0.999, 0.9999, 1.0)
+
+STATS_CSV_HEADER = [
+    "Type", "Name", "Request Count", "Failure Count",
+    "Median Response Time", "Average Response Time",
+    "Min Response Time", "Max Response Time",
+    "Average Content Size", "Requests/s", "Failures/s",
+    "50%", "66%", "75%", "80%", "90%", "95%", "98%", "99%", "99.9%", "99.99%", "100%",
+]
+
+
+# =============================================================================
+# Statistics Aggregation
+# =============================================================================
+
+def _round_response_time(response_time: float) -> int:
+    """Bucket a response time the same way Locust does for its percentiles."""
+    if response_time < 100:
+        return round(response_time)
+    if response_time < 1000:
+        return int(round(response_time, -1))
+    if response_time < 10000:
+        return int(round(response_time, -2))
+    return int(round(response_time, -3))
+
+
+class EndpointStats:
+    """Running statistics for one (method, name) pair."""
+
+    __slots__ = (
+        "method", "name", "num_requests", "num_failures", "total_response_time",
+        "min_response_time", "max_response_time", "total_content_length",
+        "response_times",
+    )
+
+    def __init__(self, method: str, name: str):
+        self.method = method
+        self.name = name
+        self.num_requests = 0
+        self.num_failures = 0
+        self.total_response_time = 0.0
+        self.min_response_time: Optional[float] = None
+        self.max_response_time = 0.0
+        self.total_content_length = 0
+        self.response_times: Dict[int, int] = {}
+
+    def log(self, response_time: float, content_length: int, failed: bool):
+        self.num_requests += 1
+        if failed:
+            self.num_failures += 1
+        self.total_response_time += response_time
+        if self.min_response_time is None or response_time < self.min_response_time:
+            self.min_response_time = response_time
+        if response_time > self.max_response_time:
+            self.max_response_time = response_time
+        self.total_content_length += content_length
+        bucket = _round_response_time(response_time)
+        self.response_times[bucket] = self.response_times.get(bucket, 0) + 1
+
+    def extend(self, other: "EndpointStats"):
+        """Merge another entry into this one (used for the Aggregated row)."""
+        self.num_requests += other.num_requests
+        self.num_failures += other.num_failures
+        self.total_response_time += other.total_response_time
+        if other.min_response_time is not None and (
+            self.min_response_time is None or other.min_response_time < self.min_response_time
+        ):
+            self.min_response_time = other.min_response_time
+        self.max_response_time = max(self.max_response_time, other.max_response_time)
+        self.total_content_length += other.total_content_length
+        for bucket, count in other.response_times.items():
+            self.response_times[bucket] = self.response_times.get(bucket, 0) + count
+
+    @property
+    def avg_response_time(self) -> float:
+        return self.total_response_time / self.num_requests if self.num_requests else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """
+        Response time below which ``percent`` of the requests completed.
+
+        Same walk as Locust's ``calculate_response_time_percentile``, so the
+        CSV columns can be compared with those of a Locust run.
+        """
+        num_requests = self.num_requests
+        num_of_request = int(num_requests * percent)
+        processed = 0
+        for bucket in sorted(self.response_times, reverse=True):
+            processed += self.response_times[bucket]
+            if num_requests - processed <= num_of_request:
+                return bucket
+        return 0
+
+    def csv_row(self, duration: float) -> list:
+        requests = self.num_requests
+        return [
+            self.method,
+            self.name,
+            requests,
+            self.num_failures,
+            self.percentile(0.5),
+            round(self.avg_response_time, 2),
+            round(self.min_response_time or 0, 2),
+            round(self.max_response_time, 2),
+            round(self.total_content_length / requests, 2) if requests else 0,
+            round(requests / duration, 2) if duration else 0,
+            round(self.num_failures / duration, 2) if duration else 0,
+            *(self.percentile(p) for p in PERCENTILES),
+        ]
+
+
+class RequestStats:
+    """Collects per-endpoint statistics for a run."""
+
+    def __init__(self):
+        self.entries: Dict[Tuple[str, str], EndpointStats] = {}
+
+    def log(self, method: str, name: str, response_time: float, content_length: int, failed: bool):
+        key = (method, name)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = EndpointStats(method, name)
+        entry.log(response_time, content_length, failed)
+
+    @property
+    def total(self) -> EndpointStats:
+        total = EndpointStats("", "Aggregated")
+        for entry in self.entries.values():
+            total.extend(entry)
+        return total
+
+    def write_csv(self, path: str, duration: float):
+        """Write a Locust-compatible ``_stats.csv`` file."""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(STATS_CSV_HEADER)
+            for key in sorted(self.entries):
+                writer.writerow(self.entries[key].csv_row(duration))
+            writer.writerow(self.total.csv_row(duration))
+
+    def log_summary(self, duration: float):
+        def rps(requests):
+            return requests / duration if duration else 0.0
+
+        logger.info("%-40s %10s %10s %10s %10s", "Name", "# reqs", "# fails", "Avg (ms)", "RPS")
+        for key in sorted(self.entries):
+            entry = self.entries[key]
+            logger.info(
+                "%-40s %10d %10d %10.2f %10.2f",
+                f"{entry.method} {entry.name}", entry.num_requests, entry.num_failures,
+                entry.avg_response_time, rps(entry.num_requests),
+            )
+        total = self.total
+        logger.info(
+            "%-40s %10d %10d %10.2f %10.2f",
+            "Aggregated", total.num_requests, total.num_failures,
+            total.avg_response_time, rps(total.num_requests),
+        )
+
+
+# =============================================================================
+# Virtual User
+# =============================================================================
+
+class VirtualUser:
+    """
+    One simulated user, mirroring the user classes in performance_demo.py.
+
+    Each check mirrors the corresponding Locust task in performance_demo.py.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, stats: RequestStats):
+        self.client = client
+        self.stats = stats
+        self.rng = rng = Lcg()
+        self._pool_ix = rng.randint(0, len(POOL_ITERATIONS) - 1)
+        self._concurrent_ix = rng.randint(0, len(CONCURRENT_POOL_PARAMS) - 1)
+        self._batch_ix = rng.randint(0, len(BATCH_PARAMS) - 1)
+        self._jpa_ix = rng.randint(0, len(JPA_RECORD_COUNTS) - 1)
+        self._iterations_ix = rng.randint(0, len(CACHE_ITERATIONS) - 1)
+
+    async def request(self, method: str, url: str, name: str, check=None, **kwargs):
+        """
+        Issue a request and record it.
+
+        Without ``check``, any HTTP error status fails the request. With
+        ``check``, the request fails unless the status is 200 and ``check``
+        returns True for the decoded JSON body.
+        """
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.stats.log(method, name, (time.perf_counter() - start) * 1000, 0, True)
+            logger.debug("Request failed: %s - %s", name, e)
+            return
+        response_time = (time.perf_counter() - start) * 1000
+        content = response.content
+
+        if check is None:
+            failed = response.is_error
+        elif response.status_code != 200:
+            failed = True
+        else:
+            try:
+                failed = not check(orjson.loads(content))
+            except Exception:
+                failed = True
+
+        self.stats.log(method, name, response_time, len(content), failed)
+
+    # Connection pooling ------------------------------------------------------
+
+    async def test_pooled_connections(self):
+        ix = self._pool_ix
+        self._pool_ix = (ix + 1) % len(POOL_ITERATIONS)
+        await self.request(
+            "GET", POOL_URLS[POOL_ITERATIONS[ix]], "Connection Pooling (Pooled)",
+            check=lambda data: data.get("speedupFactor", 0) > 2.0,
+        )
+
+    async def test_concurrent_pooling(self):
+        ix = self._concurrent_ix
+        self._concurrent_ix = (ix + 1) % len(CONCURRENT_POOL_PARAMS)
+        await self.request(
+            "GET", CONCURRENT_POOL_URLS[CONCURRENT_POOL_PARAMS[ix]], "Concurrent Connection Pooling",
+            check=lambda data: (
+                data.get("successfulQueries", 0) * 100.0 / data.get("totalQueries", 1) >= 95.0
+            ),
+        )
+
+    async def get_pool_statistics(self):
+        await self.request("GET", "/api/demos/performance/connection-pooling/stats", "Pool Statistics")
+
+    # Batch operations --------------------------------------------------------
+
+    async def test_batch_operations(self):
+        ix = self._batch_ix
+        self._batch_ix = (ix + 1) % len(BATCH_PARAMS)
+        await self.request(
+            "POST", "/api/demos/performance/batch-operations", "Batch Operations",
+            check=lambda data: data.get("speedupFactor", 0) > 3.0,
+            content=BATCH_BODIES[BATCH_PARAMS[ix]],
+        )
+
+    async def test_jpa_batch(self):
+        ix = self._jpa_ix
+        self._jpa_ix = (ix + 1) % len(JPA_RECORD_COUNTS)
+        await self.request(
+            "POST", JPA_BATCH_URLS[JPA_RECORD_COUNTS[ix]], "JPA Batch Operations",
+            check=lambda data: data.get("recordsPerSecond", 0) > 50,
+        )
+
+    # Caching -----------------------------------------------------------------
+
+    async def test_caching(self):
+        account_id = _next_id()
+        ix = self._iterations_ix
+        self._iterations_ix = (ix + 1) % len(CACHE_ITERATIONS)
+        await self.request(
+            "GET", CACHING_URLS[(account_id, CACHE_ITERATIONS[ix])], "Caching Performance",
+            check=lambda data: (
+                data.get("speedupFactor", 0) > 1.5 and data.get("cacheHitRate", 0) > 70
+            ),
+        )
+
+    async def clear_cache(self):
+        await self.request("POST", "/api/demos/performance/caching/clear", "Clear Cache")
+
+    async def get_cache_statistics(self):
+        await self.request("GET", "/api/demos/performance/caching/stats", "Cache Statistics")
+
+    # Indexing ----------------------------------------------------------------
+
+    async def test_indexing(self):
+        await self.request(
+            "GET", INDEXING_URLS[_next_id()], "Indexing Performance",
+            check=lambda data: data.get("speedupFactor", 0) > 5.0,
+        )
+
+    async def test_indexed_query_explain(self):
+        await self.request(
+            "GET", INDEXED_QUERY_URLS[_next_id()], "Indexed Query (EXPLAIN)",
+            check=lambda data: bool(data.get("usedIndex", False)),
+        )
+
+
+# Same user and task weights as the user classes in performance_demo.py.
+# As with Locust user classes, a user picks its scenario once and stays in it.
+SCENARIOS = (
+    ((
+        (VirtualUser.test_pooled_connections, 10),
+        (VirtualUser.test_concurrent_pooling, 5),
+        (VirtualUser.get_pool_statistics, 2),
+    ), 4),
+    ((
+        (VirtualUser.test_caching, 15),
+        (VirtualUser.clear_cache, 2),
+        (VirtualUser.get_cache_statistics, 3),
+    ), 3),
+    ((
+        (VirtualUser.test_batch_operations, 8),
+        (VirtualUser.test_jpa_batch, 4),
+    ), 2),
+    ((
+        (VirtualUser.test_indexing, 10),
+        (VirtualUser.test_indexed_query_explain, 5),
+    ), 1),
+)
+
+# One task sampler per scenario, shared by every virtual user on the
+# (single-threaded) event loop
+_SCENARIO_SAMPLERS = tuple(
+    (BufferedSampler(*zip(*tasks)).next, weight) for tasks, weight in SCENARIOS
+)
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+async def _run_user(user: VirtualUser, deadline: float):
+    loop = asyncio.get_running_loop()
+    next_task = weighted_choice(_SCENARIO_SAMPLERS, user.rng)
+    while loop.time() < deadline:
+        await next_task()(user)
+
+
+async def run(
+    host: str,
+    users: int,
+    run_time: float,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Tuple[RequestStats, float]:
+    """
+    Run ``users`` concurrent virtual users against ``host`` for ``run_time`` seconds.
+
+    ``timeout`` applies to connect, read, write and pool acquisition alike.
+
+    Returns:
+        The collected statistics and the measured run duration in seconds
+    """
+    stats = RequestStats()
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+
+    async with httpx.AsyncClient(
+        base_url=host,
+        headers=HEADERS,
+        limits=limits,
+        timeout=httpx.Timeout(timeout),
+    ) as client:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + run_time
+        # Cancel requests still in flight at the deadline rather than letting
+        # them run on (up to the timeout) and stretch the measured duration.
+        # Cancelled requests are not recorded.
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(_run_user(VirtualUser(client, stats), deadline) for _ in range(users))),
+                timeout=run_time,
+            )
+        except asyncio.TimeoutError:
+            pass
+        duration = min(loop.time(), deadline) - start
+
+    return stats, duration
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="http://localhost:8080", help="Base URL of the application")
+    parser.add_argument("--users", type=int, default=100, help="Number of concurrent virtual users")
+    parser.add_argument("--run-time", type=float, default=60, help="Test duration in seconds")
+    parser.add_argument(
+        "--timeout", type=float, default=DEFAULT_TIMEOUT,
+        help="Per-request timeout in seconds (default matches Locust's FastHttpUser)",
+    )
+    parser.add_argument("--csv", metavar="PREFIX", help="Write Locust-style stats to PREFIX_stats.csv")
+    parser.add_argument(
+        "--no-uvloop", action="store_true",
+        help="Use the default asyncio event loop even if uvloop is installed",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    # httpx logs every request at INFO
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    use_uvloop = uvloop is not None and sys.platform != "win32" and not args.no_uvloop
+    logger.info(
+        "Running %d users against %s for %.0fs (%s event loop)",
+        args.users, args.host, args.run_time, "uvloop" if use_uvloop else "asyncio",
+    )
+
+    run_loop = uvloop.run if use_uvloop else asyncio.run
+    stats, duration = run_loop(run(args.host, args.users, args.run_time, args.timeout))
+
+    stats.log_summary(duration)
+    if args.csv:
+        stats.write_csv(f"{args.csv}_stats.csv", duration)
+
+
+if __name__ == "__main__":
+    main()
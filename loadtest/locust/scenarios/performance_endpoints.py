@@ -0,0 +1,92 @@
+"""
+Request parameters and URLs for the performance demonstration scenarios.
+
+Every parameter domain is small and fixed, so the URLs and request bodies for
+all combinations are built once at import. Shared by the Locust scenarios in
+performance_demo.py and the asyncio runner in performance_demo_asyncio.py;
+this module must not import locust, which monkey-patches the standard library.
+
+See: specs/001-oltp-core-demo/spec.md - US3: Performance Under Load
+"""
+
+import orjson
+
+# Account and user ids present in the demo database, shared by every user
+DEMO_IDS = tuple(range(1, 101))
+
+
+# =============================================================================
+# Connection Pooling
+# =============================================================================
+
+POOL_ITERATIONS = (10, 50, 100)
+CONCURRENT_CLIENTS = (10, 20, 50)
+QUERIES_PER_CLIENT = (5, 10)
+
+# Request URLs for every parameter combination, built once at import
+POOL_URLS = {
+    iterations: f"/api/demos/performance/connection-pooling?iterations={iterations}"
+    for iterations in POOL_ITERATIONS
+}
+CONCURRENT_POOL_URLS = {
+    (clients, queries): (
+        f"/api/demos/performance/connection-pooling/concurrent"
+        f"?concurrentClients={clients}&queriesPerClient={queries}"
+    )
+    for clients in CONCURRENT_CLIENTS
+    for queries in QUERIES_PER_CLIENT
+}
+CONCURRENT_POOL_PARAMS = tuple(CONCURRENT_POOL_URLS)
+
+
+# =============================================================================
+# Batch Operations
+# =============================================================================
+
+BATCH_RECORD_COUNTS = (50, 100, 200)
+BATCH_SIZES = (50, 100)
+JPA_RECORD_COUNTS = (50, 100)
+
+# Pre-serialized JSON bodies for every (recordCount, batchSize) combination
+BATCH_BODIES = {
+    (record_count, batch_size): orjson.dumps(
+        {"recordCount": record_count, "batchSize": batch_size}
+    )
+    for record_count in BATCH_RECORD_COUNTS
+    for batch_size in BATCH_SIZES
+}
+BATCH_PARAMS = tuple(BATCH_BODIES)
+
+JPA_BATCH_URLS = {
+    record_count: f"/api/demos/performance/batch-operations/jpa?recordCount={record_count}"
+    for record_count in JPA_RECORD_COUNTS
+}
+
+
+# =============================================================================
+# Caching
+# =============================================================================
+
+CACHE_ITERATIONS = (5, 10)
+
+CACHING_URLS = {
+    (account_id, iterations): (
+        f"/api/demos/performance/caching?accountId={account_id}&iterations={iterations}"
+    )
+    for account_id in DEMO_IDS
+    for iterations in CACHE_ITERATIONS
+}
+
+
+# =============================================================================
+# Indexing
+# =============================================================================
+
+INDEXING_URLS = {
+    user_id: f"/api/demos/performance/indexing?userId={user_id}"
+    for user_id in DEMO_IDS
+}
+INDEXED_QUERY_URLS = {
+    user_id: f"/api/demos/performance/indexing/indexed-query?userId={user_id}"
+    for user_id in DEMO_IDS
+}